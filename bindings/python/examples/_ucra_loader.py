@@ -0,0 +1,63 @@
+"""
+Locate and import the built UCRA extension module.
+
+Shared by the examples and tests so the build-directory search lives in one
+place. The extension is loaded from its file path, so sys.path is left alone.
+"""
+
+import glob
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_BINDINGS_DIR = os.path.dirname(_HERE)
+_REPO_ROOT = os.path.abspath(os.path.join(_BINDINGS_DIR, '..', '..'))
+
+# CMake build first, then setup.py build outputs
+_SEARCH_DIRS = [
+    os.path.join(_REPO_ROOT, 'build', 'bindings', 'python'),
+    os.path.join(_REPO_ROOT, 'build'),
+    os.path.join(_BINDINGS_DIR, 'build'),
+    os.path.join(_BINDINGS_DIR, 'build', 'lib*'),
+]
+
+_ucra = None
+
+
+def _find_extension():
+    for pattern in _SEARCH_DIRS:
+        for directory in sorted(glob.glob(pattern)):
+            for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+                path = os.path.join(directory, 'ucra' + suffix)
+                if os.path.isfile(path):
+                    return path
+    return None
+
+
+def ensure_ucra():
+    """Return the ucra module, importing it on first use."""
+    global _ucra
+    if _ucra is not None:
+        return _ucra
+
+    try:
+        import ucra
+    except ImportError:
+        path = _find_extension()
+        if path is None:
+            raise ImportError("ucra extension not found; build it with: "
+                              "cmake --build build --target ucra_py")
+        spec = importlib.util.spec_from_file_location('ucra', path)
+        ucra = importlib.util.module_from_spec(spec)
+        # Registered before exec so the extension's own import("ucra") finds it
+        sys.modules['ucra'] = ucra
+        try:
+            spec.loader.exec_module(ucra)
+        except Exception:
+            del sys.modules['ucra']
+            raise
+
+    _ucra = ucra
+    return _ucra
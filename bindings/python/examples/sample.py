@@ -10,12 +10,10 @@ import os
 import sys
 import numpy as np
 
-# Add the built module to Python path
-build_path = os.path.join(os.path.dirname(__file__), '../../../build/bindings/python')
-sys.path.insert(0, build_path)
+from _ucra_loader import ensure_ucra
 
 try:
-    import ucra
+    ucra = ensure_ucra()
 except ImportError as e:
     print(f"Failed to import UCRA module: {e}")
     print(f"Make sure the module is built and DYLD_LIBRARY_PATH is set.")
@@ -48,8 +46,10 @@ def main():
         note1 = ucra.NoteSegment(0.0, 1.0, 69, 80, "ah")
         note2 = ucra.NoteSegment(1.0, 1.5, 72, 75, "eh")
 
-        print(f"Note 1: '{note1.lyric}' at {note1.start_sec}s for {note1.duration_sec}s (MIDI {note1.midi_note})")
-        print(f"Note 2: '{note2.lyric}' at {note2.start_sec}s for {note2.duration_sec}s (MIDI {note2.midi_note})")
+        # as_tuple() fetches every field in a single call
+        for i, note in enumerate((note1, note2), 1):
+            start, duration, midi, _velocity, lyric = note.as_tuple()
+            print(f"Note {i}: '{lyric}' at {start}s for {duration}s (MIDI {midi})")
     except Exception as e:
         print(f"Failed to create note segments: {e}")
         return 1
@@ -59,14 +59,23 @@ def main():
     try:
         # Create F0 curve (fundamental frequency)
         time_points = np.linspace(0.0, 2.0, 100, dtype=np.float32)
-        f0_values = 440.0 + 100.0 * np.sin(2 * np.pi * time_points)  # Vibrato effect
+        # Vibrato effect: 440 + 100 * sin(2*pi*t), computed in place with out=
+        # so no temporary arrays are allocated
+        f0_values = np.empty_like(time_points)
+        np.multiply(time_points, 2 * np.pi, out=f0_values)
+        np.sin(f0_values, out=f0_values)
+        np.multiply(f0_values, 100.0, out=f0_values)
+        np.add(f0_values, 440.0, out=f0_values)
 
         f0_curve = ucra.F0Curve(time_points, f0_values)
         print(f"F0 curve created with {f0_curve.length} points")
         print(f"F0 range: {f0_values.min():.1f} - {f0_values.max():.1f} Hz")
 
         # Create envelope curve
-        env_values = np.exp(-time_points * 2.0)  # Exponential decay
+        # Exponential decay: exp(-2t), also computed in place
+        env_values = np.empty_like(time_points)
+        np.multiply(time_points, -2.0, out=env_values)
+        np.exp(env_values, out=env_values)
         env_curve = ucra.EnvCurve(time_points, env_values)
         print(f"Envelope curve created with {env_curve.length} points")
 
@@ -87,6 +96,13 @@ def main():
 
         config.add_note(note1)
         config.add_note(note2)
+
+        # Many notes can be added in one call from parallel arrays
+        config.add_notes(np.array([2.5, 3.0, 3.5]),      # start_sec
+                         np.full(3, 0.5),                  # duration_sec
+                         np.array([74, 76, 77]),           # midi_note
+                         np.full(3, 80),                   # velocity
+                         ["i", "o", "u"])                  # lyrics
         print(f"Added {config.note_count} notes to configuration")
 
     except Exception as e:
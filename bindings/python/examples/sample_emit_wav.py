@@ -1,15 +1,11 @@
 #!/usr/bin/env python3
 import os, sys
-import sysconfig
 import numpy as np
 
-# Locate built extension in build/bindings/python (name ucra.*.so)
-repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../'))
-build_py_dir = os.path.join(repo_root, 'build', 'bindings', 'python')
-sys.path.insert(0, build_py_dir)
+from _ucra_loader import ensure_ucra
 
 try:
-    import ucra
+    ucra = ensure_ucra()
 except Exception as e:
     print(f"Import error: {e}")
     sys.exit(1)
@@ -17,26 +13,24 @@ except Exception as e:
 
 def write_wav_float32(path, pcm, sample_rate, channels):
     import struct
-    pcm = np.asarray(pcm, dtype=np.float32)
-    data_size = pcm.size * 4
+    # tofile() writes straight from the array buffer; make sure it is one
+    # contiguous float32 block. Render output already is, so skip the call.
+    if not (isinstance(pcm, np.ndarray) and pcm.dtype == np.float32
+            and pcm.flags['C_CONTIGUOUS']):
+        pcm = np.ascontiguousarray(pcm, dtype=np.float32)
+    data_size = pcm.nbytes
     file_size = 36 + data_size
-    with open(path, 'wb') as f:
-        f.write(b'RIFF')
-        f.write(struct.pack('<I', file_size))
-        f.write(b'WAVE')
-        f.write(b'fmt ')
-        f.write(struct.pack('<I', 16))
-        f.write(struct.pack('<H', 3))  # IEEE float
-        f.write(struct.pack('<H', channels))
-        f.write(struct.pack('<I', sample_rate))
-        byte_rate = sample_rate * channels * 4
-        f.write(struct.pack('<I', byte_rate))
-        block_align = channels * 4
-        f.write(struct.pack('<H', block_align))
-        f.write(struct.pack('<H', 32))
-        f.write(b'data')
-        f.write(struct.pack('<I', data_size))
-        f.write(pcm.tobytes())
+    byte_rate = sample_rate * channels * 4
+    block_align = channels * 4
+    # 44-byte RIFF/fmt/data header (format 3 = IEEE float) in a single write
+    header = struct.pack('<4sI4s4sIHHIIHH4sI',
+                         b'RIFF', file_size, b'WAVE',
+                         b'fmt ', 16, 3, channels, sample_rate,
+                         byte_rate, block_align, 32,
+                         b'data', data_size)
+    with open(path, 'wb', buffering=1024 * 1024) as f:
+        f.write(header)
+        pcm.tofile(f)
 
 
 def main():
@@ -46,18 +40,11 @@ def main():
     cfg = ucra.RenderConfig(sample_rate, channels, 512)
     cfg.add_note(note)
     eng = ucra.Engine()
-    res = eng.render(cfg)
-    # Handle both numpy array and wrapper object styles
-    if hasattr(res, 'pcm') and callable(getattr(res, 'pcm')):
-        pcm = np.asarray(res.pcm(), dtype=np.float32)
-        sr = getattr(res, 'sample_rate', lambda: sample_rate)()
-        ch = getattr(res, 'channels', lambda: channels)()
-    else:
-        pcm = np.asarray(res, dtype=np.float32)
-        sr = sample_rate
-        ch = channels
+    # render() returns a float32 [frames, channels] ndarray carrying
+    # sample_rate/frames/channels attributes
+    pcm = eng.render(cfg)
     out = os.path.join(os.getcwd(), 'python_sample_output.wav')
-    write_wav_float32(out, pcm, int(sr), int(ch))
+    write_wav_float32(out, pcm, pcm.sample_rate, pcm.channels)
     print('Wrote', out)
 
 if __name__ == '__main__':
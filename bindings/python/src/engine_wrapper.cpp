@@ -6,6 +6,8 @@
 #include <memory>
 #include <vector>
 #include <cstring>
+#include <cstdint>
+#include <algorithm>
 
 namespace py = pybind11;
 
@@ -69,6 +71,13 @@ public:
     int get_velocity() const { return segment_.velocity; }
     std::string get_lyric() const { return lyric_storage_; }
 
+    // All fields in one call: (start_sec, duration_sec, midi_note, velocity, lyric)
+    py::tuple as_tuple() const {
+        return py::make_tuple(segment_.start_sec, segment_.duration_sec,
+                              static_cast<int>(segment_.midi_note),
+                              static_cast<int>(segment_.velocity), lyric_storage_);
+    }
+
     // Internal access to raw data
     const UCRA_NoteSegment* get_raw() const { return &segment_; }
 
@@ -76,6 +85,52 @@ private:
     std::string lyric_storage_;
 };
 
+// Raise a Python TypeError; pybind11's type_error derives from std::runtime_error
+// and would be translated to UcraError instead (see types_wrapper.cpp)
+[[noreturn]] static void throw_type_error(const std::string& message) {
+    PyErr_SetString(PyExc_TypeError, message.c_str());
+    throw py::error_already_set();
+}
+
+// Read a 1-D integer array as int64 without truncating floats or wrapping
+// wide values; non-integer dtypes raise TypeError like the scalar NoteSegment
+static std::vector<int64_t> read_int_array(const py::array& values, const char* name) {
+    // An empty list becomes a float64 array; there is nothing to convert
+    if (values.size() == 0) {
+        return {};
+    }
+    const char kind = values.dtype().kind();
+    if (kind != 'i' && kind != 'u') {
+        throw_type_error(std::string(name) + " must be an integer array");
+    }
+    std::vector<int64_t> out(static_cast<size_t>(values.size()));
+    if (kind == 'u') {
+        auto u = py::array_t<uint64_t, py::array::c_style | py::array::forcecast>::ensure(values);
+        const uint64_t* data = u.data();
+        for (size_t i = 0; i < out.size(); ++i) {
+            // Values above INT64_MAX are clamped so the range check rejects them
+            out[i] = data[i] > static_cast<uint64_t>(INT64_MAX) ? INT64_MAX : static_cast<int64_t>(data[i]);
+        }
+    } else {
+        auto v = py::array_t<int64_t, py::array::c_style | py::array::forcecast>::ensure(values);
+        std::copy(v.data(), v.data() + out.size(), out.begin());
+    }
+    return out;
+}
+
+// Plain-data view of a note (no lyric/curve pointers) registered as a NumPy
+// structured dtype, so whole note arrays can cross the binding in one call
+struct NoteRecord {
+    double start_sec;
+    double duration_sec;
+    int16_t midi_note;
+    uint8_t velocity;
+};
+
+// No forcecast: only arrays whose dtype safely casts to NOTE_DTYPE bind, so
+// plain float arrays or out-of-range fields are never converted silently
+using NoteRecordArray = py::array_t<NoteRecord, py::array::c_style>;
+
 // Python wrapper for UCRA_RenderConfig
 class PyRenderConfig {
 private:
@@ -112,27 +167,119 @@ public:
         notes_.push_back(std::make_unique<PyNoteSegment>(
             note.get_start_sec(), note.get_duration_sec(),
             note.get_midi_note(), note.get_velocity(), note.get_lyric()));
+        append_raw(*notes_.back());
+        sync_config();
+    }
 
-        // Rebuild raw array and update config pointer
-        notes_raw_.clear();
-        notes_raw_.reserve(notes_.size());
-        for (const auto& np : notes_) {
-            UCRA_NoteSegment ns = *np->get_raw();
-            // Ensure lyric pointer points to the owned storage
-            // (np->get_raw()->lyric already points into np's storage)
-            ns.lyric = np->get_raw()->lyric;
-            ns.f0_override = nullptr;
-            ns.env_override = nullptr;
-            notes_raw_.push_back(ns);
+    // Bulk note ingest from parallel (SoA) arrays in a single call
+    void add_notes(py::array_t<double, py::array::c_style | py::array::forcecast> start_sec,
+                   py::array_t<double, py::array::c_style | py::array::forcecast> duration_sec,
+                   py::object midi_note_in,
+                   py::object velocity_in,
+                   const std::vector<std::string>& lyrics) {
+        // Integer columns keep their own dtype here; see read_int_array
+        py::array midi_note = py::array::ensure(midi_note_in);
+        py::array velocity = py::array::ensure(velocity_in);
+        if (!midi_note || !velocity) {
+            throw_type_error("midi_note and velocity must be array-like");
         }
-        config_.notes = notes_raw_.empty() ? nullptr : notes_raw_.data();
-        config_.note_count = static_cast<uint32_t>(notes_raw_.size());
+        if (start_sec.ndim() != 1 || duration_sec.ndim() != 1 ||
+            midi_note.ndim() != 1 || velocity.ndim() != 1) {
+            throw std::invalid_argument("Arrays must be 1-dimensional");
+        }
+        const py::ssize_t count = start_sec.size();
+        if (duration_sec.size() != count || midi_note.size() != count || velocity.size() != count) {
+            throw std::invalid_argument("Note arrays must have the same length");
+        }
+        if (!lyrics.empty() && static_cast<py::ssize_t>(lyrics.size()) != count) {
+            throw std::invalid_argument("Lyrics must be empty or match the note count");
+        }
+
+        const double* starts = start_sec.data();
+        const double* durations = duration_sec.data();
+        const std::vector<int64_t> midis = read_int_array(midi_note, "midi_note");
+        const std::vector<int64_t> velocities = read_int_array(velocity, "velocity");
+
+        // Validate every note before touching the config so a bad entry adds nothing
+        std::vector<std::unique_ptr<PyNoteSegment>> added;
+        added.reserve(static_cast<size_t>(count));
+        for (py::ssize_t i = 0; i < count; ++i) {
+            // Range-check at full width before narrowing to int
+            if (velocities[i] < 0 || velocities[i] > 127) {
+                throw std::invalid_argument("Velocity must be between 0 and 127");
+            }
+            if (midis[i] < -1 || midis[i] > 127) {
+                throw std::invalid_argument("MIDI note must be between -1 and 127");
+            }
+            added.push_back(std::make_unique<PyNoteSegment>(
+                starts[i], durations[i], static_cast<int>(midis[i]), static_cast<int>(velocities[i]),
+                lyrics.empty() ? std::string() : lyrics[static_cast<size_t>(i)]));
+        }
+        append_notes(added);
+    }
+
+    // Bulk note ingest from a NOTE_DTYPE structured array (AoS)
+    void add_note_records(NoteRecordArray notes, const std::vector<std::string>& lyrics) {
+        if (notes.ndim() != 1) {
+            throw std::invalid_argument("Arrays must be 1-dimensional");
+        }
+        const py::ssize_t count = notes.size();
+        if (!lyrics.empty() && static_cast<py::ssize_t>(lyrics.size()) != count) {
+            throw std::invalid_argument("Lyrics must be empty or match the note count");
+        }
+
+        const NoteRecord* records = notes.data();
+        std::vector<std::unique_ptr<PyNoteSegment>> added;
+        added.reserve(static_cast<size_t>(count));
+        for (py::ssize_t i = 0; i < count; ++i) {
+            const NoteRecord& r = records[i];
+            added.push_back(std::make_unique<PyNoteSegment>(
+                r.start_sec, r.duration_sec, r.midi_note, r.velocity,
+                lyrics.empty() ? std::string() : lyrics[static_cast<size_t>(i)]));
+        }
+        append_notes(added);
+    }
+
+    // Snapshot of all notes as a NOTE_DTYPE array (a copy: the raw note array
+    // is reallocated as notes are added, so a live view could dangle)
+    py::array_t<NoteRecord> notes_array() const {
+        py::array_t<NoteRecord> out(static_cast<py::ssize_t>(notes_raw_.size()));
+        NoteRecord* records = out.mutable_data();
+        for (size_t i = 0; i < notes_raw_.size(); ++i) {
+            const UCRA_NoteSegment& ns = notes_raw_[i];
+            records[i] = NoteRecord{ns.start_sec, ns.duration_sec, ns.midi_note, ns.velocity};
+        }
+        return out;
     }
 
     size_t get_note_count() const { return config_.note_count; }
 
     // Internal access to raw pointer
     const UCRA_RenderConfig* get_raw() const { return &config_; }
+
+private:
+    // Lyric pointers reference storage inside the heap-allocated PyNoteSegment,
+    // so entries stay valid when notes_raw_ grows and are appended, not rebuilt
+    void append_raw(const PyNoteSegment& note) {
+        UCRA_NoteSegment ns = *note.get_raw();
+        ns.f0_override = nullptr;
+        ns.env_override = nullptr;
+        notes_raw_.push_back(ns);
+    }
+
+    void append_notes(std::vector<std::unique_ptr<PyNoteSegment>>& added) {
+        notes_raw_.reserve(notes_raw_.size() + added.size());
+        for (auto& note : added) {
+            append_raw(*note);
+            notes_.push_back(std::move(note));
+        }
+        sync_config();
+    }
+
+    void sync_config() {
+        config_.notes = notes_raw_.empty() ? nullptr : notes_raw_.data();
+        config_.note_count = static_cast<uint32_t>(notes_raw_.size());
+    }
 };
 
 // Python wrapper for UCRA Engine
@@ -170,7 +317,7 @@ public:
     PyEngine& operator=(const PyEngine&) = delete;
 
     // Render method returning NumPy array (subclass with metadata attributes)
-    py::object render(PyRenderConfig& config) {
+    py::object render(PyRenderConfig& config, py::handle audio_cls) {
         UCRA_RenderResult result_data;
         UCRA_Result result = ucra_render(engine_, config.get_raw(), &result_data);
         check_ucra_result(result, "Rendering");
@@ -182,14 +329,14 @@ public:
             { sizeof(float) * result_data.channels, sizeof(float) }
         );
 
-        // Copy data to NumPy array
-        auto buf = numpy_result.request();
-        std::memcpy(buf.ptr, result_data.pcm, total_samples * sizeof(float));
+        // result_data.pcm is owned by the engine and reused by the next render,
+        // so it cannot be adopted; copy it once straight into the NumPy buffer
+        if (total_samples > 0) {
+            std::memcpy(numpy_result.mutable_data(), result_data.pcm, total_samples * sizeof(float));
+        }
 
         // Convert to our ndarray subclass so we can attach attributes
-        // Fetch the AudioArray class defined in module init (see main.cpp)
-        py::module m = py::module::import("ucra");
-        py::object audio_cls = m.attr("AudioArray");
+        // (audio_cls is the AudioArray class defined in module init, see main.cpp)
         py::object view = numpy_result.attr("view")(audio_cls);
 
         // Set metadata attributes on the subclass instance
@@ -202,6 +349,9 @@ public:
 };
 
 void bind_engine(py::module& m) {
+    PYBIND11_NUMPY_DTYPE(NoteRecord, start_sec, duration_sec, midi_note, velocity);
+    m.attr("NOTE_DTYPE") = py::dtype::of<NoteRecord>();
+
     py::class_<PyNoteSegment>(m, "NoteSegment")
         .def(py::init<double, double, int, int, const std::string&>(),
              py::arg("start_sec"), py::arg("duration_sec"),
@@ -211,7 +361,12 @@ void bind_engine(py::module& m) {
         .def_property_readonly("duration_sec", &PyNoteSegment::get_duration_sec, "Duration in seconds")
         .def_property_readonly("midi_note", &PyNoteSegment::get_midi_note, "MIDI note number")
         .def_property_readonly("velocity", &PyNoteSegment::get_velocity, "Velocity (0-127)")
-        .def_property_readonly("lyric", &PyNoteSegment::get_lyric, "Lyric text");
+        .def_property_readonly("lyric", &PyNoteSegment::get_lyric, "Lyric text")
+        .def("as_tuple", &PyNoteSegment::as_tuple,
+             "Return (start_sec, duration_sec, midi_note, velocity, lyric)")
+        .def("__repr__", [](const PyNoteSegment& n) {
+            return "NoteSegment" + py::repr(n.as_tuple()).cast<std::string>();
+        });
 
     py::class_<PyRenderConfig>(m, "RenderConfig")
         .def(py::init<uint32_t, uint32_t, uint32_t, uint32_t>(),
@@ -223,11 +378,48 @@ void bind_engine(py::module& m) {
         .def_property_readonly("block_size", &PyRenderConfig::get_block_size, "Block size")
         .def_property_readonly("flags", &PyRenderConfig::get_flags, "Render flags")
         .def("add_note", &PyRenderConfig::add_note, py::arg("note"), "Add a note segment")
+        .def("add_notes", &PyRenderConfig::add_notes,
+             py::arg("start_sec"), py::arg("duration_sec"), py::arg("midi_note"), py::arg("velocity"),
+             py::arg("lyrics") = std::vector<std::string>{},
+             "Add many notes at once from parallel arrays")
+        .def("add_notes", &PyRenderConfig::add_note_records,
+             py::arg("notes"), py::arg("lyrics") = std::vector<std::string>{},
+             "Add many notes at once from a NOTE_DTYPE structured array")
+        .def("notes_array", &PyRenderConfig::notes_array,
+             "Return all notes as a NOTE_DTYPE structured array")
         .def_property_readonly("note_count", &PyRenderConfig::get_note_count, "Number of notes");
 
     py::class_<PyEngine>(m, "Engine")
-        .def(py::init<const std::map<std::string, std::string>&>(),
+        .def(py::init([](std::map<std::string, std::string> options, py::object voicebank_path,
+                         uint32_t sample_rate, bool test_mode, py::kwargs extra) {
+                 // Known options arrive as typed keyword arguments; only unknown
+                 // keys go through the generic kwargs/options string conversion
+                 if (!voicebank_path.is_none()) {
+                     options["voicebank_path"] = py::str(voicebank_path);
+                 }
+                 if (sample_rate > 0) {
+                     options["sample_rate"] = std::to_string(sample_rate);
+                 }
+                 if (test_mode) {
+                     options["test_mode"] = "true";
+                 }
+                 for (auto item : extra) {
+                     options[py::str(item.first)] = py::str(item.second);
+                 }
+                 return std::make_unique<PyEngine>(options);
+             }),
              py::arg("options") = std::map<std::string, std::string>{},
-             "Create a UCRA engine")
-        .def("render", &PyEngine::render, py::arg("config"), "Render audio with given configuration");
+             py::kw_only(),
+             py::arg("voicebank_path") = py::none(),
+             py::arg("sample_rate") = 0,
+             py::arg("test_mode") = false,
+             "Create a UCRA engine. Known options may be passed as keywords "
+             "(voicebank_path, sample_rate, test_mode); other keywords are "
+             "forwarded to the engine as string options")
+        // AudioArray is created in main.cpp before bind_engine runs; the binding
+        // holds a reference to it so render() needs no per-call module lookup
+        .def("render", [audio_cls = py::object(m.attr("AudioArray"))](PyEngine& engine, PyRenderConfig& config) {
+                 return engine.render(config, audio_cls);
+             },
+             py::arg("config"), "Render audio with given configuration");
 }
@@ -16,9 +16,11 @@ PYBIND11_MODULE(ucra, m) {
 
     // Define a simple ndarray subclass to carry audio metadata attributes
     // This enables tests to access attributes like sample_rate/frames/channels
+    // The attributes are slots, so render results carry no per-instance __dict__
     py::object np = py::module::import("numpy");
     py::object ndarray = np.attr("ndarray");
-    py::object dict = py::dict();
+    py::dict dict;
+    dict["__slots__"] = py::make_tuple("sample_rate", "frames", "channels");
     py::object bases = py::make_tuple(ndarray);
     py::object AudioArray = py::reinterpret_borrow<py::object>(PyObject_CallFunctionObjArgs((PyObject*)&PyType_Type,
                                                                                            py::str("AudioArray").ptr(),
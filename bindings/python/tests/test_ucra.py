@@ -9,18 +9,11 @@ import os
 try:
     import ucra
 except ImportError:
-    # Add build directory to path if not installed
-    build_dirs = [
-        os.path.join(os.path.dirname(__file__), "..", "build"),
-        os.path.join(os.path.dirname(__file__), "..", "build", "lib"),
-    ]
+    # Not installed: locate the build output with the shared examples helper
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+    from _ucra_loader import ensure_ucra
 
-    for build_dir in build_dirs:
-        if os.path.exists(build_dir):
-            sys.path.insert(0, build_dir)
-            break
-
-    import ucra
+    ucra = ensure_ucra()
 
 
 class TestUcraTypes:
@@ -72,6 +65,13 @@ class TestNoteSegment:
         assert note.velocity == 80   # Default
         assert note.lyric == ""      # Default
 
+    def test_note_as_tuple(self):
+        """Test reading all note fields in one call."""
+        note = ucra.NoteSegment(0.5, 2.0, 72, 100, "la")
+
+        assert note.as_tuple() == (0.5, 2.0, 72, 100, "la")
+        assert repr(note) == "NoteSegment(0.5, 2.0, 72, 100, 'la')"
+
     def test_invalid_duration(self):
         """Test that invalid durations raise exceptions."""
         with pytest.raises(ValueError):
@@ -122,6 +122,24 @@ class TestCurves:
         np.testing.assert_array_equal(curve.time_sec, time)
         np.testing.assert_array_equal(curve.value, value)
 
+    def test_curve_shares_input_memory(self):
+        """Test that float32 contiguous inputs are referenced, not copied."""
+        time = np.array([0.0, 0.5, 1.0], dtype=np.float32)
+        f0 = np.array([440.0, 550.0, 660.0], dtype=np.float32)
+
+        curve = ucra.F0Curve(time, f0)
+        del time
+
+        assert np.shares_memory(curve.f0_hz, f0)
+        np.testing.assert_array_equal(curve.time_sec, [0.0, 0.5, 1.0])
+
+    def test_curve_converts_other_dtypes(self):
+        """Test that float64 inputs are still accepted."""
+        curve = ucra.EnvCurve(np.linspace(0.0, 1.0, 4), np.ones(4))
+
+        assert curve.length == 4
+        assert curve.value.dtype == np.float32
+
     def test_curve_mismatched_arrays(self):
         """Test that mismatched array sizes raise exceptions."""
         time = np.array([0.0, 0.5], dtype=np.float32)
@@ -187,6 +205,92 @@ class TestRenderConfig:
 
         assert config.note_count == 3
 
+    def test_add_notes_bulk(self):
+        """Test adding notes from parallel arrays in one call."""
+        config = ucra.RenderConfig()
+        config.add_note(ucra.NoteSegment(0.0, 1.0))
+
+        config.add_notes(np.arange(3, dtype=np.float64) + 1.0,
+                         np.full(3, 0.5),
+                         np.array([60, 62, 64]),
+                         np.array([80, 90, 100]),
+                         ["do", "re", "mi"])
+        config.add_notes([4.0], [1.0], [65], [70])
+        config.add_notes([], [], [], [])
+
+        assert config.note_count == 5
+
+    def test_add_notes_structured(self):
+        """Test adding notes from a NOTE_DTYPE array and reading them back."""
+        notes = np.zeros(2, dtype=ucra.NOTE_DTYPE)
+        notes['start_sec'] = [0.0, 1.0]
+        notes['duration_sec'] = 1.0
+        notes['midi_note'] = [60, 67]
+        notes['velocity'] = 100
+
+        config = ucra.RenderConfig()
+        config.add_note(ucra.NoteSegment(2.0, 0.5, 72, 80, "la"))
+        config.add_notes(notes, ["do", "so"])
+
+        assert config.note_count == 3
+        out = config.notes_array()
+        assert out.dtype == ucra.NOTE_DTYPE
+        np.testing.assert_array_equal(out['midi_note'], [72, 60, 67])
+        np.testing.assert_array_equal(out['start_sec'], [2.0, 0.0, 1.0])
+
+    def test_add_notes_structured_rejects_other_dtypes(self):
+        """Test that only NOTE_DTYPE arrays bind to the structured overload."""
+        config = ucra.RenderConfig()
+
+        with pytest.raises(TypeError):
+            config.add_notes(np.array([1.0, 2.0]))
+
+        wide = np.zeros(1, dtype=[('start_sec', 'f8'), ('duration_sec', 'f8'),
+                                  ('midi_note', 'i2'), ('velocity', 'i2')])
+        wide['duration_sec'] = 1.0
+        wide['midi_note'] = 60
+        wide['velocity'] = 300
+        with pytest.raises(TypeError):
+            config.add_notes(wide)
+
+        assert config.note_count == 0
+
+    def test_add_notes_invalid(self):
+        """Test that bulk ingest validates every note and adds none on error."""
+        config = ucra.RenderConfig()
+
+        with pytest.raises(ValueError):
+            config.add_notes([0.0, 1.0], [1.0], [60, 62], [80, 80])
+
+        with pytest.raises(ValueError):
+            config.add_notes([0.0, 1.0], [1.0, 0.0], [60, 62], [80, 80])
+
+        assert config.note_count == 0
+
+    def test_add_notes_rejects_non_integer_notes(self):
+        """Test that float MIDI/velocity arrays are rejected, not truncated."""
+        config = ucra.RenderConfig()
+
+        with pytest.raises(TypeError):
+            config.add_notes([0.0], [1.0], np.array([60.9]), [80])
+
+        with pytest.raises(TypeError):
+            config.add_notes([0.0], [1.0], [60], np.array([80.0]))
+
+        assert config.note_count == 0
+
+    def test_add_notes_rejects_wide_integers(self):
+        """Test that out-of-range int64/uint64 values fail instead of wrapping."""
+        config = ucra.RenderConfig()
+
+        with pytest.raises(ValueError):
+            config.add_notes([0.0], [1.0], np.array([2**32 + 61], dtype=np.int64), [80])
+
+        with pytest.raises(ValueError):
+            config.add_notes([0.0], [1.0], [60], np.array([2**64 - 1], dtype=np.uint64))
+
+        assert config.note_count == 0
+
 
 class TestEngine:
     """Test Engine functionality."""
@@ -212,6 +316,15 @@ class TestEngine:
             # Expected in test environment
             assert "Not supported" in str(e) or "creation failed" in str(e)
 
+    def test_engine_creation_with_keywords(self):
+        """Test engine creation with keyword options."""
+        try:
+            engine = ucra.Engine(sample_rate=48000, test_mode=True, frame_period=5.0)
+            assert engine is not None
+        except ucra.UcraError as e:
+            # Expected in test environment
+            assert "Not supported" in str(e) or "creation failed" in str(e)
+
     def test_engine_render(self):
         """Test engine rendering (expected to fail)."""
         try:
@@ -228,6 +341,7 @@ class TestEngine:
             assert hasattr(result, 'sample_rate')
             assert hasattr(result, 'frames')
             assert hasattr(result, 'channels')
+            assert not hasattr(result, '__dict__')
 
         except ucra.UcraError as e:
             # Expected in test environment
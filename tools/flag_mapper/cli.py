@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import json
+import os
+import sys
 from flag_mapper.loader import MappingRuleSet, RuleLoadError
 from flag_mapper.transform import TransformEngine
 
@@ -8,14 +11,31 @@ def parse_flags(s: str):
     out = {}
     if not s:
         return out
-    parts = s.split(';')
-    for p in parts:
-        if '=' in p:
-            k,v = p.split('=',1)
+    for p in s.split(';'):
+        k, sep, v = p.partition('=')
+        if sep:
             out[k.strip()] = v.strip()
     return out
 
 
+@functools.lru_cache(maxsize=32)
+def _build_engine(rule_path: str, schema_path: str, mtime: int, schema_mtime: int):
+    ruleset = MappingRuleSet.load(rule_path, schema_path)
+    return TransformEngine(ruleset.rules)
+
+
+def build_engine(rule_path: str, schema_path: str):
+    """Return a TransformEngine for the rule file, reused until either file changes."""
+    if not os.path.exists(rule_path):
+        raise RuleLoadError(f"Rule file not found: {rule_path}")
+    return _build_engine(rule_path, schema_path,
+                         os.stat(rule_path).st_mtime_ns, os.stat(schema_path).st_mtime_ns)
+
+
+def apply_flags(engine: TransformEngine, flags: str):
+    return engine.apply_fast(parse_flags(flags))
+
+
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('--rule', required=True)
@@ -23,13 +43,11 @@ def main():
     p.add_argument('--flags', default='')
     args = p.parse_args()
     try:
-        ruleset = MappingRuleSet.load(args.rule, args.schema)
+        eng = build_engine(args.rule, args.schema)
     except RuleLoadError as e:
         print(f"Error loading rules: {e}")
         return 2
-    eng = TransformEngine(ruleset.rules)
-    legacy = parse_flags(args.flags)
-    out = eng.apply(legacy)
+    out = apply_flags(eng, args.flags)
     print(json.dumps(out['result']))
     if out['warnings']:
         print('\nWarnings:', file=sys.stderr)
@@ -38,5 +56,4 @@ def main():
     return 0
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
@@ -1,4 +1,4 @@
-from .loader import MappingRuleSet, RuleLoadError
+from .loader import CompiledRule, MappingRuleSet, RuleLoadError
 from .transform import TransformEngine
 
-__all__ = ["MappingRuleSet", "RuleLoadError", "TransformEngine"]
+__all__ = ["CompiledRule", "MappingRuleSet", "RuleLoadError", "TransformEngine"]
@@ -0,0 +1,62 @@
+# cython: language_level=3
+"""Compiled fast path for TransformEngine.apply.
+
+Optional; build in place from tools/flag_mapper with:
+
+    cythonize -i flag_mapper/_transform_c.pyx
+
+TransformEngine.apply_fast falls back to the pure-Python apply when this
+extension is not built.
+"""
+
+# Must match the KIND_* codes in transform.py
+cdef enum:
+    KIND_COPY = 0
+    KIND_SCALE = 1
+    KIND_MAP = 2
+    KIND_CONSTANT = 3
+    KIND_UNKNOWN = 4
+
+cdef class CompiledRuleSet:
+    cdef list plan
+
+    def __init__(self, plan):
+        # (kind_code, src, tgt, has_default, default, payload) in rule order
+        self.plan = []
+        for step in plan:
+            step = tuple(step)
+            if len(step) != 6:
+                raise ValueError(f"plan step must have 6 fields, got {len(step)}")
+            self.plan.append(step)
+
+    def apply(self, flags):
+        # Accept any Mapping like the pure-Python apply; exact dicts are used as is
+        cdef dict legacy_flags = flags if type(flags) is dict else dict(flags)
+        cdef dict result = {}
+        cdef list warnings = []
+        cdef int code
+        for code, src, tgt, has_default, default, payload in self.plan:
+            if src not in legacy_flags:
+                # apply default if any
+                if has_default:
+                    result[tgt] = default
+                continue
+            val = legacy_flags[src]
+            if code == KIND_COPY:
+                result[tgt] = val
+            elif code == KIND_SCALE:
+                try:
+                    # linear scale from [0,1] -> [lo,hi]
+                    result[tgt] = payload[0] + payload[1]*float(val)
+                except Exception:
+                    warnings.append(f"scale: could not convert {val} to float for {src}")
+            elif code == KIND_MAP:
+                if val in payload:
+                    result[tgt] = payload[val]
+                else:
+                    warnings.append(f"map: value {val} not in mapping for {src}")
+            elif code == KIND_CONSTANT:
+                result[tgt] = payload
+            else:
+                warnings.append(f"unknown transform kind: {payload}")
+        return {'result': result, 'warnings': warnings}
@@ -1,14 +1,83 @@
 import json
-from jsonschema import validate, ValidationError
+from jsonschema import Draft7Validator, ValidationError
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup, stdlib json accepts bytes too
+    _loads = json.loads
+
+try:
+    import fastjsonschema
+    _VALIDATION_ERRORS = (ValidationError, fastjsonschema.JsonSchemaValueException)
+except ImportError:  # optional speedup, falls back to jsonschema
+    fastjsonschema = None
+    _VALIDATION_ERRORS = (ValidationError,)
 
 class RuleLoadError(Exception):
     pass
 
+class CompiledRule(NamedTuple):
+    """Immutable, flattened form of one mapping rule."""
+    src: str
+    tgt: str
+    kind: str
+    scale_lo: float = 0
+    scale_span: float = 1
+    map_: Mapping = MappingProxyType({})
+    value: Any = None
+    default: Any = None
+    has_default: bool = False
+
+def compile_rule(r: Dict) -> CompiledRule:
+    target = r['target']
+    transform = r.get('transform', {'kind':'copy'})
+    kind = transform.get('kind','copy')
+    lo, span = 0, 1
+    if kind == 'scale':
+        lo, hi = transform.get('scale', [0,1])
+        span = hi-lo
+    return CompiledRule(
+        src=r['source']['name'],
+        tgt=target['name'],
+        kind=kind,
+        scale_lo=lo,
+        scale_span=span,
+        map_=MappingProxyType(dict(transform.get('map', {}))),
+        value=transform.get('value'),
+        default=target.get('default'),
+        has_default='default' in target,
+    )
+
+# Loaded rule sets and compiled validators, keyed by path with the mtime kept
+# in the value: an edited file replaces its entry on the next load.
+_RULE_CACHE = {}
+_VALIDATOR_CACHE = {}
+
+def _get_validator(schema_path: str, schema_mtime: int):
+    cached = _VALIDATOR_CACHE.get(schema_path)
+    if cached is not None and cached[0] == schema_mtime:
+        validator = cached[1]
+    else:
+        schema = _loads(Path(schema_path).read_bytes())
+        if fastjsonschema is not None:
+            # compiles the schema into a specialized Python function; defaults
+            # and formats stay off to match jsonschema's validate-only behaviour
+            validator = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        else:
+            Draft7Validator.check_schema(schema)
+            validator = Draft7Validator(schema).validate
+        _VALIDATOR_CACHE[schema_path] = (schema_mtime, validator)
+    return validator
+
 class MappingRuleSet:
     def __init__(self, engine, rules, version=None):
         self.engine = engine
-        self.rules = rules
+        self.rules = tuple(r if isinstance(r, CompiledRule) else compile_rule(r)
+                           for r in rules or ())
         self.version = version
 
     @staticmethod
@@ -16,10 +85,22 @@ class MappingRuleSet:
         p = Path(path)
         if not p.exists():
             raise RuleLoadError(f"Rule file not found: {path}")
-        data = json.loads(p.read_text())
-        schema = json.loads(Path(schema_path).read_text())
+        mtime = p.stat().st_mtime_ns
+        schema_mtime = Path(schema_path).stat().st_mtime_ns
+        key = (str(p), str(schema_path))
+        stamp = (mtime, schema_mtime)
+        cached = _RULE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = _loads(p.read_bytes())
+        validator = _get_validator(str(schema_path), schema_mtime)
         try:
-            validate(instance=data, schema=schema)
-        except ValidationError as e:
+            validator(data)
+        except _VALIDATION_ERRORS as e:
             raise RuleLoadError(f"Schema validation failed: {e.message}")
-        return MappingRuleSet(data.get('engine'), data.get('rules'), data.get('version'))
+        try:
+            ruleset = MappingRuleSet(data.get('engine'), data.get('rules'), data.get('version'))
+        except (KeyError, TypeError, ValueError) as e:
+            raise RuleLoadError(f"Invalid rule: {e!r}")
+        _RULE_CACHE[key] = (stamp, ruleset)
+        return ruleset
@@ -1,45 +1,76 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+
+from .loader import CompiledRule, compile_rule
+
+try:
+    from ._transform_c import CompiledRuleSet
+except ImportError:  # C extension not built, apply_fast uses apply
+    CompiledRuleSet = None
 
 class TransformError(Exception):
     pass
 
+# Transform kind codes used in the precompiled rule plan (mirrored in _transform_c.pyx)
+KIND_COPY, KIND_SCALE, KIND_MAP, KIND_CONSTANT, KIND_UNKNOWN = range(5)
+
 class TransformEngine:
-    def __init__(self, rules: List[Dict]):
+    def __init__(self, rules: List[Union[CompiledRule, Dict]]):
         self.rules = rules
+        # Precompile rules once into flat tuples, kept in rule order so later
+        # rules still win, and apply() never re-reads rule fields per call.
+        self._plan = []
+        for r in rules:
+            rule = r if isinstance(r, CompiledRule) else compile_rule(r)
+            kind = rule.kind
+            if kind == 'copy':
+                code, payload = KIND_COPY, None
+            elif kind == 'scale':
+                code, payload = KIND_SCALE, (rule.scale_lo, rule.scale_span)
+            elif kind == 'map':
+                code, payload = KIND_MAP, dict(rule.map_)
+            elif kind == 'constant':
+                code, payload = KIND_CONSTANT, rule.value
+            else:
+                code, payload = KIND_UNKNOWN, kind
+            self._plan.append((code, rule.src, rule.tgt, rule.has_default, rule.default, payload))
+        self._compiled = None
+        if CompiledRuleSet is not None:
+            self._compiled = CompiledRuleSet(self._plan)
 
     def apply(self, legacy_flags: Dict[str, Any]) -> Dict[str, Any]:
         result = {}
         warnings = []
-        # rules is list of objects with source, target, transform
-        for r in self.rules:
-            src = r['source']['name']
-            tgt = r['target']['name']
-            transform = r.get('transform', {'kind':'copy'})
+        res = result
+        append_warn = warnings.append
+        for code, src, tgt, has_default, default, payload in self._plan:
             if src not in legacy_flags:
                 # apply default if any
-                if 'default' in r['target']:
-                    result[tgt] = r['target']['default']
+                if has_default:
+                    res[tgt] = default
                 continue
             val = legacy_flags[src]
-            kind = transform.get('kind','copy')
-            if kind == 'copy':
-                result[tgt] = val
-            elif kind == 'scale':
-                lo, hi = transform.get('scale', [0,1])
+            if code == KIND_COPY:
+                res[tgt] = val
+            elif code == KIND_SCALE:
+                lo, span = payload
                 try:
-                    f = float(val)
                     # linear scale from [0,1] -> [lo,hi]
-                    result[tgt] = lo + (hi-lo)*f
+                    res[tgt] = lo + span*float(val)
                 except Exception:
-                    warnings.append(f"scale: could not convert {val} to float for {src}")
-            elif kind == 'map':
-                mp = transform.get('map', {})
-                if val in mp:
-                    result[tgt] = mp[val]
+                    append_warn(f"scale: could not convert {val} to float for {src}")
+            elif code == KIND_MAP:
+                if val in payload:
+                    res[tgt] = payload[val]
                 else:
-                    warnings.append(f"map: value {val} not in mapping for {src}")
-            elif kind == 'constant':
-                result[tgt] = transform.get('value')
+                    append_warn(f"map: value {val} not in mapping for {src}")
+            elif code == KIND_CONSTANT:
+                res[tgt] = payload
             else:
-                warnings.append(f"unknown transform kind: {kind}")
+                append_warn(f"unknown transform kind: {payload}")
         return {'result': result, 'warnings': warnings}
+
+    def apply_fast(self, legacy_flags: Dict[str, Any]) -> Dict[str, Any]:
+        """Same as apply(), using the compiled _transform_c extension if built."""
+        if self._compiled is None:
+            return self.apply(legacy_flags)
+        return self._compiled.apply(legacy_flags)
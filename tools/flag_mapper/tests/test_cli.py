@@ -0,0 +1,23 @@
+from cli import apply_flags, build_engine, parse_flags
+
+
+def test_parse_flags():
+    assert parse_flags('') == {}
+    assert parse_flags(' g = 0.5 ;v=10;') == {'g':'0.5', 'v':'10'}
+
+
+def test_parse_flags_skips_bare_parts():
+    out = parse_flags('junk;mode=1;a=b=c')
+    assert out == {'mode':'1', 'a':'b=c'}
+    assert parse_flags('=mode=2') == {'':'mode=2'}
+    assert parse_flags('g=0.5;=v=10') == {'g':'0.5', '':'v=10'}
+    assert parse_flags('x mode=1') == {'x mode':'1'}
+
+
+def test_build_engine_reused():
+    rule = 'mappings/moresampler_map.json'
+    schema = 'flag_mapper/schema/mapping_schema.json'
+    eng = build_engine(rule, schema)
+    assert build_engine(rule, schema) is eng
+    out = apply_flags(eng, 'mode=2')
+    assert out['result']['articulation'] == 'accent'
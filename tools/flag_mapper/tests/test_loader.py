@@ -1,5 +1,6 @@
 import pytest
-from flag_mapper.loader import MappingRuleSet, RuleLoadError
+from flag_mapper import loader
+from flag_mapper.loader import MappingRuleSet, RuleLoadError, compile_rule
 
 
 def test_load_valid(tmp_path):
@@ -23,3 +24,76 @@ def test_load_invalid_schema(tmp_path):
     data.write_text('{"engine": 123}')
     with pytest.raises(RuleLoadError):
         MappingRuleSet.load(str(data), str(schema))
+
+
+def test_load_cached_until_modified(tmp_path):
+    import os
+    schema = tmp_path / 'schema.json'
+    schema.write_text('{"type":"object","required":["engine","rules"]}')
+    data = tmp_path / 'map.json'
+    data.write_text('{"engine":"moresampler","rules": []}')
+    first = MappingRuleSet.load(str(data), str(schema))
+    assert MappingRuleSet.load(str(data), str(schema)) is first
+    data.write_text('{"engine":"tn_fnds","rules": []}')
+    st = data.stat()
+    os.utime(data, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert MappingRuleSet.load(str(data), str(schema)).engine == 'tn_fnds'
+    assert sum(1 for k in loader._RULE_CACHE if k[0] == str(data)) == 1
+    assert list(loader._VALIDATOR_CACHE).count(str(schema)) == 1
+
+
+def test_load_compiles_rules():
+    mr = MappingRuleSet.load('mappings/moresampler_map.json', 'flag_mapper/schema/mapping_schema.json')
+    assert isinstance(mr.rules, tuple)
+    gender = mr.rules[0]
+    assert (gender.src, gender.tgt, gender.kind) == ('g', 'gender', 'scale')
+    assert (gender.scale_lo, gender.scale_span) == (-1.0, 2.0)
+    assert gender.has_default and gender.default == '0.0'
+    assert mr.rules[3].map_['1'] == 'staccato'
+
+
+def test_load_uncompilable_rule(tmp_path):
+    schema = tmp_path / 'schema.json'
+    schema.write_text('{"type":"object","required":["engine","rules"]}')
+    data = tmp_path / 'map.json'
+    data.write_text('{"engine":"moresampler","rules":[{"source":{"name":"a"}}]}')
+    with pytest.raises(RuleLoadError):
+        MappingRuleSet.load(str(data), str(schema))
+    data.write_text('{"engine":"moresampler","rules":[{"source":{"name":"a"},"target":{"name":"b"},'
+                    '"transform":{"kind":"scale","scale":[0]}}]}')
+    with pytest.raises(RuleLoadError):
+        MappingRuleSet.load(str(data), str(schema))
+
+
+def test_scale_only_read_for_scale_rules():
+    rule = compile_rule({'source':{'name':'a'}, 'target':{'name':'b'},
+                         'transform':{'kind':'copy','scale':'ignored'}})
+    assert rule.kind == 'copy'
+
+
+@pytest.fixture(params=['fastjsonschema', 'jsonschema'])
+def backend(request, monkeypatch):
+    if request.param == 'fastjsonschema':
+        pytest.importorskip('fastjsonschema')
+    else:
+        monkeypatch.setattr(loader, 'fastjsonschema', None)
+    monkeypatch.setattr(loader, '_RULE_CACHE', {})
+    monkeypatch.setattr(loader, '_VALIDATOR_CACHE', {})
+    return request.param
+
+
+def test_backends_validate_only(tmp_path, backend):
+    schema = tmp_path / 'schema.json'
+    schema.write_text('{"type":"object","required":["engine","rules"],"properties":{'
+                      '"engine":{"type":"string","format":"email"},'
+                      '"version":{"type":"string","default":"1.0"},"rules":{"type":"array"}}}')
+    data = tmp_path / 'map.json'
+    data.write_text('{"engine":"moresampler","rules": []}')
+    mr = MappingRuleSet.load(str(data), str(schema))
+    assert mr.engine == 'moresampler'
+    assert mr.version is None
+
+    bad = tmp_path / 'bad.json'
+    bad.write_text('{"engine": 123, "rules": []}')
+    with pytest.raises(RuleLoadError):
+        MappingRuleSet.load(str(bad), str(schema))
@@ -1,3 +1,6 @@
+from collections import UserDict
+
+import pytest
 from flag_mapper.transform import TransformEngine
 
 
@@ -33,3 +36,96 @@ def test_map_missing_warns():
     out = eng.apply({'mode':'1'})
     assert 'mode' not in out['result']
     assert len(out['warnings']) == 1
+
+
+def test_default_and_constant():
+    rules = [{
+        'source': {'name':'B'},
+        'target': {'name':'breathiness','default':'0.0'},
+        'transform': {'kind':'scale','scale':[0,1]}
+    }, {
+        'source': {'name':'e'},
+        'target': {'name':'engine'},
+        'transform': {'kind':'constant','value':'world'}
+    }]
+    eng = TransformEngine(rules)
+    out = eng.apply({'e':'1'})
+    assert out['result'] == {'breathiness':'0.0', 'engine':'world'}
+    assert eng.apply({'e':'1'}) == out
+
+
+def test_apply_fast_matches_apply():
+    rules = [{
+        'source': {'name':'g'},
+        'target': {'name':'gender','default':'0.0'},
+        'transform': {'kind':'scale','scale':[-1.0,1.0]}
+    }, {
+        'source': {'name':'mode'},
+        'target': {'name':'articulation'},
+        'transform': {'kind':'map','map':{'0':'legato'}}
+    }, {
+        'source': {'name':'x'},
+        'target': {'name':'x'},
+        'transform': {'kind':'copy'}
+    }]
+    eng = TransformEngine(rules)
+    for flags in ({}, {'g':'0.25','mode':'0','x':'1'}, {'g':'bad','mode':'5'}):
+        assert eng.apply_fast(flags) == eng.apply(flags)
+
+
+def test_later_rule_wins_same_target():
+    rules = [
+        {'source': {'name':'a'}, 'target': {'name':'t'}, 'transform': {'kind':'constant','value':'C'}},
+        {'source': {'name':'b'}, 'target': {'name':'t'}, 'transform': {'kind':'copy'}},
+        {'source': {'name':'m'}, 'target': {'name':'u'}, 'transform': {'kind':'copy'}},
+        {'source': {'name':'n'}, 'target': {'name':'u','default':'D'}, 'transform': {'kind':'copy'}},
+    ]
+    eng = TransformEngine(rules)
+    out = eng.apply({'a':'A', 'b':'B', 'm':'M'})
+    assert out['result'] == {'t':'B', 'u':'D'}
+    assert list(out['result']) == ['t', 'u']
+    assert eng.apply_fast({'a':'A', 'b':'B', 'm':'M'}) == out
+
+
+def test_result_and_warning_order_follow_rules():
+    rules = [
+        {'source': {'name':'mode'}, 'target': {'name':'articulation'}, 'transform': {'kind':'map','map':{}}},
+        {'source': {'name':'g'}, 'target': {'name':'gender','default':'0.0'}, 'transform': {'kind':'scale','scale':[-1,1]}},
+        {'source': {'name':'v'}, 'target': {'name':'velocity'}, 'transform': {'kind':'scale','scale':[0,127]}},
+        {'source': {'name':'B'}, 'target': {'name':'breathiness','default':'0.0'}, 'transform': {'kind':'copy'}},
+    ]
+    eng = TransformEngine(rules)
+    out = eng.apply({'mode':'9', 'g':'0.5', 'v':'x'})
+    assert list(out['result']) == ['gender', 'breathiness']
+    assert out['warnings'][0].startswith('map:')
+    assert out['warnings'][1].startswith('scale:')
+
+
+def test_compiled_rule_set_matches_apply():
+    _transform_c = pytest.importorskip('flag_mapper._transform_c')
+
+    class FlagDict(dict):
+        pass
+
+    rules = [{
+        'source': {'name':'v'},
+        'target': {'name':'velocity','default':100},
+        'transform': {'kind':'scale','scale':[0,127]}
+    }, {
+        'source': {'name':'mode'},
+        'target': {'name':'articulation'},
+        'transform': {'kind':'map','map':{'0':'legato'}}
+    }]
+    eng = TransformEngine(rules)
+    compiled = _transform_c.CompiledRuleSet(eng._plan)
+    for flags in ({'v':'0.5','mode':'0'}, {'mode':'7'}, {'v':'bad'}):
+        expected = eng.apply(flags)
+        assert compiled.apply(flags) == expected
+        assert compiled.apply(FlagDict(flags)) == expected
+        assert compiled.apply(UserDict(flags)) == expected
+
+
+def test_compiled_rule_set_rejects_bad_plan():
+    _transform_c = pytest.importorskip('flag_mapper._transform_c')
+    with pytest.raises(ValueError):
+        _transform_c.CompiledRuleSet([(0, 'a', 'b')])